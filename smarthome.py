@@ -1,35 +1,164 @@
 #!/usr/bin/env python3
 """CLI interface for managing Shelly devices (Gen 2/3) via local HTTP API."""
 
+from __future__ import annotations
+
 import argparse
+import hashlib
 import json
+import mmap
+import os
 import sys
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, BinaryIO, Callable, NamedTuple, TypeVar
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON (de)serialization
+    orjson = None
+
+# asyncio, requests and aiohttp are imported into module scope on first use (see _session() and
+# _import_async()) so commands without network I/O start faster
+if TYPE_CHECKING:
+    import asyncio
 
-import requests
+    import aiohttp
+    import requests
 
 MAPPINGS_FILE = Path(__file__).parent / "mappings.json"
 REQUEST_TIMEOUT = 5
+MAX_CONCURRENCY = 16  # max in-flight device requests per fan-out
+MMAP_THRESHOLD = 64 * 1024  # mappings files above this size are parsed from an mmap
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+T = TypeVar("T")
+
+# Shared session so repeated requests to the same device reuse keep-alive sockets, created by _session()
+_SESSION: requests.Session | None = None
+
+# Full request URLs keyed by (ip, path), filled by _url()
+_URL_CACHE: dict[tuple[str, str], str] = {}
+
+# Parsed mappings.json, a digest of its on-disk bytes and the (inode, mtime_ns, size) it was read at,
+# populated lazily by load_mappings()
+_MAPPINGS_CACHE: dict | None = None
+_MAPPINGS_DIGEST: bytes | None = None
+_MAPPINGS_STAMP: tuple[int, int, int] | None = None
+
+
+class Device(NamedTuple):
+    """A resolved device target."""
+
+    hw_id: str
+    ip: str
+    alias: str
+
+
+# ─── JSON ───────────────────────────────────────────────────────────────────────
+
+def _loads(raw: bytes | str) -> object:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: object, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available.
+
+    Output is compact, or indented by two spaces if pretty. Both backends format strings, lists,
+    dicts and 64-bit integers identically, which covers mappings.json. Floats can differ (orjson
+    writes 1.5e16 where the stdlib writes 1.5e+16), and orjson rejects integers beyond 64 bits.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _print_json(obj: object, pretty: bool = False) -> None:
+    """Write obj as a single JSON document to stdout."""
+    sys.stdout.buffer.write(_dumps(obj, pretty) + b"\n")
+    sys.stdout.flush()
 
 
 # ─── Persistence ────────────────────────────────────────────────────────────────
 
 def load_mappings() -> dict:
-    """Load device/group mappings from disk. Returns empty structure if file missing."""
-    if MAPPINGS_FILE.exists():
-        return json.loads(MAPPINGS_FILE.read_text(encoding="utf-8"))
-    return {"devices": {}, "groups": {}}
+    """Load device/group mappings from disk. Returns empty structure if file missing.
+
+    The parsed mappings are cached and reused for as long as the file's inode, mtime and size are
+    unchanged, so long-running callers still pick up writes made by other processes. The cached dict
+    is returned as-is; if save_mappings() fails, the cache is dropped so unsaved edits are not reused.
+    """
+    global _MAPPINGS_CACHE, _MAPPINGS_DIGEST, _MAPPINGS_STAMP
+    try:
+        f = open(MAPPINGS_FILE, "rb")
+    except FileNotFoundError:
+        _MAPPINGS_CACHE, _MAPPINGS_DIGEST, _MAPPINGS_STAMP = {"devices": {}, "groups": {}}, None, None
+        return _MAPPINGS_CACHE
+    with f:
+        st = os.fstat(f.fileno())
+        stamp = _stamp(st)
+        if _MAPPINGS_CACHE is None or stamp != _MAPPINGS_STAMP:
+            _MAPPINGS_CACHE, _MAPPINGS_DIGEST = _parse_mappings(f, st.st_size)
+            _MAPPINGS_STAMP = stamp
+    return _MAPPINGS_CACHE
+
+
+def _stamp(st: os.stat_result) -> tuple[int, int, int]:
+    """Identify a version of the mappings file. Each save replaces the file, so the inode changes too."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _parse_mappings(f: BinaryIO, size: int) -> tuple[dict, bytes]:
+    """Parse an open mappings file. Returns the data and a digest of the file contents.
+
+    Large files are parsed straight from an mmap when orjson is available, avoiding a copy into a bytes object.
+    """
+    if orjson is not None and size > MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view), hashlib.blake2b(view).digest()
+    raw = f.read()
+    return _loads(raw), hashlib.blake2b(raw).digest()
 
 
 def save_mappings(data: dict) -> None:
-    """Persist device/group mappings to disk."""
-    MAPPINGS_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    """Persist device/group mappings to disk atomically. Skips the write if nothing changed."""
+    global _MAPPINGS_CACHE, _MAPPINGS_DIGEST, _MAPPINGS_STAMP
+    new_bytes = _dumps(data, pretty=True) + b"\n"
+    new_digest = hashlib.blake2b(new_bytes).digest()
+    if new_digest != _MAPPINGS_DIGEST:
+        # Write to a unique sibling temp file and rename over the original, so a crash never leaves a
+        # partial file and concurrent writers never share a temp file
+        fd, tmp = tempfile.mkstemp(dir=MAPPINGS_FILE.parent, prefix=".mappings.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # Keep the original file's permissions, e.g. a user-restricted 0600 mappings.json
+                try:
+                    os.fchmod(f.fileno(), os.stat(MAPPINGS_FILE).st_mode & 0o7777)
+                except FileNotFoundError:
+                    pass
+                f.write(new_bytes)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, MAPPINGS_FILE)
+        except BaseException:
+            os.unlink(tmp)
+            # The cached dict holds the unsaved edits; force the next load to re-read the file
+            _MAPPINGS_CACHE = None
+            raise
+        _MAPPINGS_STAMP = _stamp(os.stat(MAPPINGS_FILE))
+    _MAPPINGS_CACHE = data
+    _MAPPINGS_DIGEST = new_digest
 
 
 # ─── Target Resolution ──────────────────────────────────────────────────────────
 
-def resolve_targets(data: dict, target: str) -> list[dict]:
-    """Resolve a target string to a list of device dicts with keys 'hw_id', 'ip', 'alias'.
+def resolve_targets(data: dict, target: str) -> list[Device]:
+    """Resolve a target string to a list of Devices.
 
     Resolution order: 'all' -> group name -> alias -> hardware_id.
     Prints warnings to stderr for unresolvable targets.
@@ -38,19 +167,22 @@ def resolve_targets(data: dict, target: str) -> list[dict]:
     groups = data["groups"]
 
     if target == "all":
-        return [{"hw_id": k, **v} for k, v in devices.items()]
+        return [_make_device(k, v) for k, v in devices.items()]
+
+    alias_index = _build_alias_index(devices)
 
     if target in groups:
+        memo: dict[str, Device | None] = {}
         results = []
         for member in groups[target]:
-            resolved = _resolve_single(devices, member)
+            resolved = _resolve_single(devices, alias_index, member, memo)
             if resolved:
                 results.append(resolved)
             else:
                 print(f"WARNING: group member '{member}' could not be resolved, skipping", file=sys.stderr)
         return results
 
-    single = _resolve_single(devices, target)
+    single = _resolve_single(devices, alias_index, target)
     if single:
         return [single]
 
@@ -58,19 +190,39 @@ def resolve_targets(data: dict, target: str) -> list[dict]:
     sys.exit(1)
 
 
-def _resolve_single(devices: dict, identifier: str) -> dict | None:
-    """Resolve a single identifier (alias or hardware_id) to a device dict."""
-    # Check alias first
+def _make_device(hw_id: str, info: dict) -> Device:
+    """Build a Device from a hardware_id and its mappings entry."""
+    return Device(hw_id, info["ip"], info.get("alias", ""))
+
+
+def _build_alias_index(devices: dict) -> dict[str, str]:
+    """Map each non-empty alias to its hardware_id. The first device wins on duplicate aliases."""
+    index: dict[str, str] = {}
     for hw_id, info in devices.items():
-        if info.get("alias") == identifier:
-            return {"hw_id": hw_id, **info}
-    # Check hardware_id
-    if identifier in devices:
-        return {"hw_id": identifier, **devices[identifier]}
-    return None
+        alias = info.get("alias")
+        if alias:
+            index.setdefault(alias, hw_id)
+    return index
+
 
+def _resolve_single(
+    devices: dict, alias_index: dict[str, str], identifier: str, memo: dict[str, Device | None] | None = None
+) -> Device | None:
+    """Resolve a single identifier (alias or hardware_id) to a Device.
 
-def resolve_single_device(data: dict, target: str) -> dict:
+    If a memo dict is given, results (including misses) are cached in it by identifier.
+    """
+    if memo is not None and identifier in memo:
+        return memo[identifier]
+    # Check alias first, then hardware_id
+    hw_id = alias_index.get(identifier, identifier)
+    device = _make_device(hw_id, devices[hw_id]) if hw_id in devices else None
+    if memo is not None:
+        memo[identifier] = device
+    return device
+
+
+def resolve_single_device(data: dict, target: str) -> Device:
     """Resolve target to exactly one device. Exit on ambiguity or miss."""
     results = resolve_targets(data, target)
     if len(results) != 1:
@@ -81,11 +233,33 @@ def resolve_single_device(data: dict, target: str) -> dict:
 
 # ─── HTTP helpers ────────────────────────────────────────────────────────────────
 
+def _url(ip: str, path: str) -> str:
+    """Return the request URL for a device path, reusing previously built strings."""
+    key = (ip, path)
+    url = _URL_CACHE.get(key)
+    if url is None:
+        url = _URL_CACHE[key] = f"http://{ip}{path}"
+    return url
+
+
+def _session() -> requests.Session:
+    """Return the shared requests session, importing requests and creating the session on first use."""
+    global _SESSION, requests
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+    return _SESSION
+
+
 def shelly_get(ip: str, path: str) -> dict | None:
     """Send a GET request to a Shelly device. Returns parsed JSON or None on failure."""
-    url = f"http://{ip}{path}"
+    session = _session()
+    url = _url(ip, path)
     try:
-        resp = requests.get(url, timeout=REQUEST_TIMEOUT)
+        resp = session.get(url, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
         return resp.json()
     except requests.RequestException as exc:
@@ -95,9 +269,15 @@ def shelly_get(ip: str, path: str) -> dict | None:
 
 def shelly_post(ip: str, path: str, payload: dict) -> dict | None:
     """Send a POST request with JSON body to a Shelly device."""
-    url = f"http://{ip}{path}"
+    return shelly_post_raw(ip, path, _dumps(payload))
+
+
+def shelly_post_raw(ip: str, path: str, body: bytes) -> dict | None:
+    """Send a POST request with an already serialized JSON body to a Shelly device."""
+    session = _session()
+    url = _url(ip, path)
     try:
-        resp = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+        resp = session.post(url, data=body, headers=_JSON_HEADERS, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
         return resp.json()
     except requests.RequestException as exc:
@@ -105,6 +285,119 @@ def shelly_post(ip: str, path: str, payload: dict) -> dict | None:
         return None
 
 
+async def _shelly_get_async(session: aiohttp.ClientSession, ip: str, path: str) -> dict | None:
+    """Async variant of shelly_get using a shared aiohttp session."""
+    url = _url(ip, path)
+    try:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            return await resp.json(loads=_loads, content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+        print(f"ERROR: request to {url} failed: {str(exc) or type(exc).__name__}", file=sys.stderr)
+        return None
+
+
+async def _shelly_post_async(session: aiohttp.ClientSession, ip: str, path: str, body: bytes) -> dict | None:
+    """Async variant of shelly_post_raw using a shared aiohttp session."""
+    url = _url(ip, path)
+    try:
+        async with session.post(url, data=body, headers=_JSON_HEADERS) as resp:
+            resp.raise_for_status()
+            return await resp.json(loads=_loads, content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+        print(f"ERROR: request to {url} failed: {str(exc) or type(exc).__name__}", file=sys.stderr)
+        return None
+
+
+def _import_async() -> None:
+    """Import asyncio and aiohttp into module scope on first use by the fan-out helpers."""
+    global asyncio, aiohttp
+    import asyncio
+
+    import aiohttp
+
+
+def _client_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session that keeps per-device connections alive for reuse."""
+    # At most one in-flight request per device; small devices do not cope well with more
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=1, keepalive_timeout=30, force_close=False)
+    # Per-phase timeouts rather than 'total', which would also count time spent queued behind
+    # another request to the same device and cut the second request short
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def _bounded(sem: asyncio.Semaphore, coro: Awaitable[T]) -> T:
+    """Await coro while holding sem."""
+    async with sem:
+        return await coro
+
+
+def _collect(targets: list[Device], results: list) -> list[dict | None]:
+    """Map gather() results back to targets, turning unexpected exceptions into None."""
+    collected = []
+    for dev, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            print(f"ERROR: request to {dev.ip} failed: {result!r}", file=sys.stderr)
+            result = None
+        collected.append(result)
+    return collected
+
+
+def shelly_get_many(targets: list[Device], path: str) -> list[dict | None]:
+    """Send the same GET request to all target devices concurrently.
+
+    Returns one parsed response (or None on failure) per target, in target order.
+    """
+    _import_async()
+
+    async def _run() -> list:
+        async with _client_session() as session:
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            tasks = [_bounded(sem, _shelly_get_async(session, dev.ip, path)) for dev in targets]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    return _collect(targets, asyncio.run(_run()))
+
+
+def shelly_get_stream(targets: list[Device], path: str, callback: Callable[[Device, dict | None], None]) -> None:
+    """Send the same GET request to all target devices concurrently.
+
+    Calls callback(device, response) as each request completes, in completion order.
+    """
+    _import_async()
+
+    async def _fetch(session: aiohttp.ClientSession, sem: asyncio.Semaphore, dev: Device) -> tuple[Device, dict | None]:
+        try:
+            return dev, await _bounded(sem, _shelly_get_async(session, dev.ip, path))
+        except Exception as exc:
+            print(f"ERROR: request to {dev.ip} failed: {exc!r}", file=sys.stderr)
+            return dev, None
+
+    async def _run() -> None:
+        async with _client_session() as session:
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            for coro in asyncio.as_completed([_fetch(session, sem, dev) for dev in targets]):
+                callback(*await coro)
+
+    asyncio.run(_run())
+
+
+def shelly_post_many(targets: list[Device], path: str, payload: dict) -> list[dict | None]:
+    """Send the same JSON POST request to all target devices concurrently."""
+    _import_async()
+
+    body = _dumps(payload)  # serialize once, not per device
+
+    async def _run() -> list:
+        async with _client_session() as session:
+            sem = asyncio.Semaphore(MAX_CONCURRENCY)
+            tasks = [_bounded(sem, _shelly_post_async(session, dev.ip, path, body)) for dev in targets]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    return _collect(targets, asyncio.run(_run()))
+
+
 # ─── Device Management ───────────────────────────────────────────────────────────
 
 def cmd_add(args: argparse.Namespace) -> None:
@@ -126,29 +419,34 @@ def cmd_add(args: argparse.Namespace) -> None:
     alias = str(args.alias) if args.alias is not None else ""
     data["devices"][hw_id] = {"ip": args.ip, "alias": alias, "model": model}
     save_mappings(data)
-    print(json.dumps({"ok": True, "hw_id": hw_id, "ip": args.ip, "alias": alias, "model": model}))
+    _print_json({"ok": True, "hw_id": hw_id, "ip": args.ip, "alias": alias, "model": model})
 
 
 def cmd_remove(args: argparse.Namespace) -> None:
     """Remove a device from mappings and all groups."""
     data = load_mappings()
     dev = resolve_single_device(data, args.target)
-    hw_id = dev["hw_id"]
+    hw_id = dev.hw_id
 
     del data["devices"][hw_id]
-    for members in data["groups"].values():
-        members[:] = [m for m in members if m != hw_id and m != dev.get("alias")]
+    drop = {hw_id}
+    if dev.alias:
+        drop.add(dev.alias)
+    for gname, members in data["groups"].items():
+        if drop.isdisjoint(members):
+            continue
+        data["groups"][gname] = [m for m in members if m not in drop]
     save_mappings(data)
-    print(json.dumps({"ok": True, "removed": hw_id}))
+    _print_json({"ok": True, "removed": hw_id})
 
 
 def cmd_rename(args: argparse.Namespace) -> None:
     """Update the alias of an existing device."""
     data = load_mappings()
     dev = resolve_single_device(data, args.target)
-    data["devices"][dev["hw_id"]]["alias"] = str(args.new_alias)
+    data["devices"][dev.hw_id]["alias"] = str(args.new_alias)
     save_mappings(data)
-    print(json.dumps({"ok": True, "hw_id": dev["hw_id"], "alias": str(args.new_alias)}))
+    _print_json({"ok": True, "hw_id": dev.hw_id, "alias": str(args.new_alias)})
 
 
 # ─── Group Management ────────────────────────────────────────────────────────────
@@ -163,7 +461,7 @@ def cmd_group(args: argparse.Namespace) -> None:
             sys.exit(1)
         data["groups"][args.group_name] = []
         save_mappings(data)
-        print(json.dumps({"ok": True, "created": args.group_name}))
+        _print_json({"ok": True, "created": args.group_name})
 
     elif args.group_action == "delete":
         if args.group_name not in data["groups"]:
@@ -171,7 +469,7 @@ def cmd_group(args: argparse.Namespace) -> None:
             sys.exit(1)
         del data["groups"][args.group_name]
         save_mappings(data)
-        print(json.dumps({"ok": True, "deleted": args.group_name}))
+        _print_json({"ok": True, "deleted": args.group_name})
 
     elif args.group_action == "add":
         if args.group_name not in data["groups"]:
@@ -180,12 +478,12 @@ def cmd_group(args: argparse.Namespace) -> None:
         targets = resolve_targets(data, args.target)
         added = []
         for dev in targets:
-            identifier = dev["alias"] if dev.get("alias") else dev["hw_id"]
+            identifier = dev.alias or dev.hw_id
             if identifier not in data["groups"][args.group_name]:
                 data["groups"][args.group_name].append(identifier)
                 added.append(identifier)
         save_mappings(data)
-        print(json.dumps({"ok": True, "group": args.group_name, "added": added}))
+        _print_json({"ok": True, "group": args.group_name, "added": added})
 
     elif args.group_action == "remove":
         if args.group_name not in data["groups"]:
@@ -195,12 +493,12 @@ def cmd_group(args: argparse.Namespace) -> None:
         removed = []
         for dev in targets:
             members = data["groups"][args.group_name]
-            for ident in (dev.get("alias"), dev["hw_id"]):
+            for ident in (dev.alias, dev.hw_id):
                 if ident and ident in members:
                     members.remove(ident)
                     removed.append(ident)
         save_mappings(data)
-        print(json.dumps({"ok": True, "group": args.group_name, "removed": removed}))
+        _print_json({"ok": True, "group": args.group_name, "removed": removed})
 
 
 # ─── Actions ─────────────────────────────────────────────────────────────────────
@@ -208,40 +506,46 @@ def cmd_group(args: argparse.Namespace) -> None:
 def cmd_on(args: argparse.Namespace) -> None:
     """Turn on relay for target device(s)."""
     data = load_mappings()
+    targets = resolve_targets(data, args.target)
     results = []
-    for dev in resolve_targets(data, args.target):
-        resp = shelly_get(dev["ip"], "/rpc/Switch.Set?id=0&on=true")
-        results.append({"hw_id": dev["hw_id"], "alias": dev.get("alias", ""), "success": resp is not None})
-    print(json.dumps(results))
+    for dev, resp in zip(targets, shelly_get_many(targets, "/rpc/Switch.Set?id=0&on=true")):
+        results.append({"hw_id": dev.hw_id, "alias": dev.alias, "success": resp is not None})
+    _print_json(results)
 
 
 def cmd_off(args: argparse.Namespace) -> None:
     """Turn off relay for target device(s)."""
     data = load_mappings()
+    targets = resolve_targets(data, args.target)
     results = []
-    for dev in resolve_targets(data, args.target):
-        resp = shelly_get(dev["ip"], "/rpc/Switch.Set?id=0&on=false")
-        results.append({"hw_id": dev["hw_id"], "alias": dev.get("alias", ""), "success": resp is not None})
-    print(json.dumps(results))
+    for dev, resp in zip(targets, shelly_get_many(targets, "/rpc/Switch.Set?id=0&on=false")):
+        results.append({"hw_id": dev.hw_id, "alias": dev.alias, "success": resp is not None})
+    _print_json(results)
 
 
 def cmd_toggle(args: argparse.Namespace) -> None:
     """Toggle relay for target device(s)."""
     data = load_mappings()
+    targets = resolve_targets(data, args.target)
     results = []
-    for dev in resolve_targets(data, args.target):
-        resp = shelly_get(dev["ip"], "/rpc/Switch.Toggle?id=0")
-        results.append({"hw_id": dev["hw_id"], "alias": dev.get("alias", ""), "success": resp is not None})
-    print(json.dumps(results))
+    for dev, resp in zip(targets, shelly_get_many(targets, "/rpc/Switch.Toggle?id=0")):
+        results.append({"hw_id": dev.hw_id, "alias": dev.alias, "success": resp is not None})
+    _print_json(results)
 
 
 def cmd_status(args: argparse.Namespace) -> None:
-    """Query switch status (output state, power, energy) for target device(s)."""
+    """Query switch status (output state, power, energy) for target device(s).
+
+    Entries are streamed to stdout as a JSON array in the order devices respond.
+    """
     data = load_mappings()
-    results = []
-    for dev in resolve_targets(data, args.target):
-        resp = shelly_get(dev["ip"], "/rpc/Switch.GetStatus?id=0")
-        entry = {"hw_id": dev["hw_id"], "alias": dev.get("alias", ""), "online": resp is not None}
+    targets = resolve_targets(data, args.target)
+    out = sys.stdout.buffer
+    sep = b""
+
+    def emit(dev: Device, resp: dict | None) -> None:
+        nonlocal sep
+        entry = {"hw_id": dev.hw_id, "alias": dev.alias, "online": resp is not None}
         if resp is not None:
             entry["output"] = resp.get("output")
             # Shelly 1 Mini Gen3 has no power measurement, check if key exists
@@ -249,8 +553,14 @@ def cmd_status(args: argparse.Namespace) -> None:
                 entry["apower"] = resp["apower"]
             if "aenergy" in resp:
                 entry["aenergy_total"] = resp["aenergy"].get("total")
-        results.append(entry)
-    print(json.dumps(results))
+        out.write(sep + _dumps(entry))
+        out.flush()
+        sep = b","
+
+    out.write(b"[")
+    shelly_get_stream(targets, "/rpc/Switch.GetStatus?id=0", emit)
+    out.write(b"]\n")
+    out.flush()
 
 
 def cmd_led(args: argparse.Namespace) -> None:
@@ -262,23 +572,15 @@ def cmd_led(args: argparse.Namespace) -> None:
 
     data = load_mappings()
     payload = {"config": {"leds": {"mode": args.mode}}}
+    targets = resolve_targets(data, args.target)
     results = []
-    for dev in resolve_targets(data, args.target):
-        # Identify if device supports LED (e.g. S1MINI has none). 
-        # For now, we try; if it fails or model is known S1MINI, we note it.
-        # But to be safe and simple: just try. If it fails, mark success: false.
-        
-        # Exception: if we KNOW it's a Mini, skip it to avoid errors log.
-        # However, we might not have 'model' in stored mappings yet for old devices.
-        # So we just try.
-        
-        resp = shelly_post(dev["ip"], "/rpc/PLUGS_UI.SetConfig", payload)
-        
-        # If response is an error because method not found (e.g. Mini), resp might be None or contain 'error'.
-        # Shelly 1 Mini Gen3 returns error for PLUGS_UI.SetConfig.
+    # Devices without an LED ring (e.g. Shelly 1 Mini Gen3) return an error for
+    # PLUGS_UI.SetConfig, and older mappings may lack 'model', so we just try all
+    # targets and report success: false for those that fail.
+    for dev, resp in zip(targets, shelly_post_many(targets, "/rpc/PLUGS_UI.SetConfig", payload)):
         success = resp is not None and "error" not in resp
-        results.append({"hw_id": dev["hw_id"], "alias": dev.get("alias", ""), "success": success})
-    print(json.dumps(results))
+        results.append({"hw_id": dev.hw_id, "alias": dev.alias, "success": success})
+    _print_json(results)
 
 
 # ─── List ────────────────────────────────────────────────────────────────────────
@@ -286,7 +588,7 @@ def cmd_led(args: argparse.Namespace) -> None:
 def cmd_list(_args: argparse.Namespace) -> None:
     """List all registered devices and groups from mappings."""
     data = load_mappings()
-    print(json.dumps(data, indent=2))
+    _print_json(data, pretty=True)
 
 
 # ─── CLI Parser ──────────────────────────────────────────────────────────────────
@@ -348,10 +650,23 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the hot '<action> <target>' and 'list' invocations without building the full parser.
+
+    Returns None for any other shape (including options such as -h), which is left to argparse.
+    """
+    if argv == ["list"]:
+        return argparse.Namespace(command="list")
+    if len(argv) == 2 and argv[0] in ("on", "off", "toggle", "status") and not argv[1].startswith("-"):
+        return argparse.Namespace(command=argv[0], target=argv[1])
+    return None
+
+
 def main() -> None:
     """Entry point — parse args and dispatch to the matching command handler."""
-    parser = build_parser()
-    args = parser.parse_args()
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
 
     dispatch = {
         "add": cmd_add,